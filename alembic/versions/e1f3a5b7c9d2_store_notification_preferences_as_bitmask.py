@@ -0,0 +1,103 @@
+# Copyright (c) 2025-2026 Sunet.
+# Contributor: Kristofer Hallin
+#
+# This file is part of Sunet Scribe.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Store notification preferences as a bitmask.
+
+Revision ID: e1f3a5b7c9d2
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f3a5b7c9d2"
+down_revision: Union[str, Sequence[str], None] = "c4d5e6f7a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match db.models.NotificationFlag.
+FLAGS = [
+    ("job", 1),
+    ("deletion", 2),
+    ("user", 4),
+    ("quota", 8),
+    ("weekly_report", 16),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    columns = [x["name"] for x in inspector.get_columns("users")]
+
+    if "notifications_bits" not in columns:
+        op.add_column(
+            "users",
+            sa.Column(
+                "notifications_bits",
+                sa.SmallInteger(),
+                nullable=False,
+                server_default="0",
+            ),
+        )
+
+    if "notifications" in columns:
+        bits = " + ".join(
+            f"(CASE WHEN ',' || notifications || ',' LIKE '%,{token},%' "
+            f"THEN {bit} ELSE 0 END)"
+            for token, bit in FLAGS
+        )
+        op.execute(
+            sa.text(
+                f"UPDATE users SET notifications_bits = {bits} "
+                "WHERE notifications IS NOT NULL"
+            )
+        )
+        op.drop_column("users", "notifications")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    columns = [x["name"] for x in inspector.get_columns("users")]
+
+    if "notifications" not in columns:
+        op.add_column(
+            "users",
+            sa.Column("notifications", sa.VARCHAR(), nullable=True),
+        )
+
+    if "notifications_bits" in columns:
+        tokens = " || ".join(
+            f"(CASE WHEN notifications_bits & {bit} <> 0 "
+            f"THEN '{token},' ELSE '' END)"
+            for token, bit in FLAGS
+        )
+        op.execute(sa.text(f"UPDATE users SET notifications = {tokens}"))
+        op.drop_column("users", "notifications_bits")
@@ -44,6 +44,7 @@ from db.user import (
 )
 from db.customer import check_quota_alerts, send_weekly_usage_reports
 from db.group import check_group_quota_alerts
+from db.session import warm_connection_pool
 
 from fastapi.openapi.utils import get_openapi
 from routers.admin import router as admin_router
@@ -59,6 +60,7 @@ from routers.user import router as user_router
 from routers.videostream import router as videostream_router
 
 from utils.log import get_logger
+from utils.notifications import notifications
 from utils.settings import get_settings
 
 settings = get_settings()
@@ -447,6 +449,36 @@ def check_quota_alerts_task() -> None:
     check_group_quota_alerts()
 
 
+@app.on_event("startup")
+async def start_notifications() -> None:
+    """
+    Start the background task that sends e-mail notifications.
+    """
+
+    notifications.start()
+
+
+@app.on_event("shutdown")
+async def stop_notifications() -> None:
+    """
+    Stop the background task that sends e-mail notifications.
+    """
+
+    await notifications.stop()
+
+
+@app.on_event("startup")
+async def warm_connection_pool_on_startup() -> None:
+    """
+    Fill the database connection pool before serving traffic.
+    """
+
+    try:
+        await warm_connection_pool()
+    except Exception as e:
+        log.warning(f"Failed to warm up database connection pool: {e}")
+
+
 @app.on_event("startup")
 async def seed_onboarding_attributes_on_startup() -> None:
     """
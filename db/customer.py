@@ -22,7 +22,7 @@ from datetime import datetime, timedelta
 
 from sqlalchemy import or_, select
 
-from db.models import Customer, Job, JobType, User
+from db.models import Customer, Job, JobType, NotificationFlag, User
 from db.session import get_async_session, get_session
 from typing import Optional
 from utils.log import get_logger
@@ -873,10 +873,7 @@ def check_quota_alerts() -> None:
                 )
 
                 for admin_user in admin_users:
-                    if (
-                        not admin_user.notifications
-                        or "quota" not in admin_user.notifications.split(",")
-                    ):
+                    if not admin_user.notifications_bits & NotificationFlag.QUOTA:
                         continue
 
                     if not admin_user.email:
@@ -887,7 +884,7 @@ def check_quota_alerts() -> None:
                     ):
                         continue
 
-                    notifications.send_quota_alert(
+                    if not notifications.send_quota_alert(
                         to_email=admin_user.email,
                         customer_name=customer.name,
                         usage_percent=usage_percent,
@@ -895,7 +892,8 @@ def check_quota_alerts() -> None:
                         minutes_included=minutes_included,
                         minutes_consumed=minutes_consumed,
                         remaining_minutes=stats.get("remaining_minutes", 0),
-                    )
+                    ):
+                        continue
 
                     notifications.notification_sent_record_add(
                         admin_user.user_id, str(customer.id), "quota_alert"
@@ -949,10 +947,7 @@ def send_weekly_usage_reports() -> None:
 
         # Send one email per admin user with aggregated stats
         for user_id, (admin_user, customer_ids) in admin_customer_map.items():
-            if (
-                not admin_user.notifications
-                or "weekly_report" not in admin_user.notifications.split(",")
-            ):
+            if not admin_user.notifications_bits & NotificationFlag.WEEKLY_REPORT:
                 continue
 
             if not admin_user.email:
@@ -16,7 +16,7 @@
 # limitations under the License.
 
 from db.customer import customer_get_from_user_id
-from db.models import Group, GroupModelLink, GroupUserLink, User
+from db.models import Group, GroupModelLink, GroupUserLink, NotificationFlag, User
 from db.session import get_async_session, get_session
 from sqlalchemy import func, or_, select
 from sqlalchemy.orm import selectinload
@@ -658,7 +658,7 @@ def check_group_quota_alerts() -> None:
             ).all()
 
             for admin_user in admin_users:
-                if not admin_user.notifications or "quota" not in admin_user.notifications.split(","):
+                if not admin_user.notifications_bits & NotificationFlag.QUOTA:
                     continue
 
                 if not admin_user.email:
@@ -669,14 +669,15 @@ def check_group_quota_alerts() -> None:
                 ):
                     continue
 
-                notifications.send_group_quota_alert(
+                if not notifications.send_group_quota_alert(
                     to_email=admin_user.email,
                     group_name=group.name,
                     usage_percent=usage_percent,
                     quota_minutes=quota_minutes,
                     used_minutes=used_minutes,
                     remaining_minutes=remaining_minutes,
-                )
+                ):
+                    continue
 
                 notifications.notification_sent_record_add(
                     admin_user.user_id, str(group.id), "group_quota_alert"
@@ -24,6 +24,7 @@ from db.models import (
     JobStatusEnum,
     JobType,
     Jobs,
+    NotificationFlag,
     OutputFormatEnum,
     User,
 )
@@ -418,84 +419,87 @@ def job_cleanup() -> None:
             user_rows = session.query(User).filter(User.user_id.in_(all_user_ids)).all()
             users_map = {u.user_id: u for u in user_rows}
 
-        for job in jobs_to_cleanup:
-            # Inline job removal logic (job_remove is now async)
-            file_path = Path(settings.API_FILE_STORAGE_DIR) / job.user_id / job.uuid
-            file_path_mp4 = (
-                Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.mp4"
-            )
-            file_path_mp4_enc = (
-                Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.mp4.enc"
-            )
-            file_path_enc = (
-                Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.enc"
-            )
+        # Each job is only seen once per loop, so the sent records can be
+        # written in one batch after each loop.
+        sent_records = []
 
-            if file_path.exists():
-                file_path.unlink()
-
-            if file_path_mp4.exists():
-                file_path_mp4.unlink()
-
-            if file_path_enc.exists():
-                file_path_enc.unlink()
-
-            if file_path_mp4_enc.exists():
-                file_path_mp4_enc.unlink()
-
-            # Anonymize job data instead of deleting the record.
-            # We keep the record for auditing and billing purposes.
-            job.job_type = "transcription"
-            job.language = ""
-            job.model_type = ""
-            job.filename = ""
-            job.error = ""
-            job.speakers = "0"
-            job.status = JobStatusEnum.DELETED
-            job.output_format = OutputFormatEnum.NONE
-
-            # Remove JobResult associated with the job
-            job_results = (
-                session.query(JobResult)
-                .filter(JobResult.job_id == job.uuid)
-                .with_for_update()
-                .all()
-            )
+        try:
+            for job in jobs_to_cleanup:
+                # Inline job removal logic (job_remove is now async)
+                file_path = Path(settings.API_FILE_STORAGE_DIR) / job.user_id / job.uuid
+                file_path_mp4 = (
+                    Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.mp4"
+                )
+                file_path_mp4_enc = (
+                    Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.mp4.enc"
+                )
+                file_path_enc = (
+                    Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.enc"
+                )
 
-            # Delete associated job results.
-            for result in job_results:
-                log.info(
-                    f"Job result for job {result.job_id} created at {result.created_at} removed for user {result.user_id}."
+                if file_path.exists():
+                    file_path.unlink()
+
+                if file_path_mp4.exists():
+                    file_path_mp4.unlink()
+
+                if file_path_enc.exists():
+                    file_path_enc.unlink()
+
+                if file_path_mp4_enc.exists():
+                    file_path_mp4_enc.unlink()
+
+                # Anonymize job data instead of deleting the record.
+                # We keep the record for auditing and billing purposes.
+                job.job_type = "transcription"
+                job.language = ""
+                job.model_type = ""
+                job.filename = ""
+                job.error = ""
+                job.speakers = "0"
+                job.status = JobStatusEnum.DELETED
+                job.output_format = OutputFormatEnum.NONE
+
+                # Remove JobResult associated with the job
+                job_results = (
+                    session.query(JobResult)
+                    .filter(JobResult.job_id == job.uuid)
+                    .with_for_update()
+                    .all()
                 )
-                session.delete(result)
 
-            if job.status == JobStatusEnum.DELETED:
-                continue
+                # Delete associated job results.
+                for result in job_results:
+                    log.info(
+                        f"Job result for job {result.job_id} created at {result.created_at} removed for user {result.user_id}."
+                    )
+                    session.delete(result)
 
-            user = users_map.get(job.user_id)
+                if job.status == JobStatusEnum.DELETED:
+                    continue
 
-            if not user or not user.notifications:
-                continue
+                user = users_map.get(job.user_id)
 
-            if "deletion" not in user.notifications.split(","):
-                continue
+                if not user or not user.notifications_bits & NotificationFlag.DELETION:
+                    continue
 
-            if user.email == "":
-                continue
+                if user.email == "":
+                    continue
 
-            if notifications.notification_sent_record_exists(
-                user.user_id, job.uuid, "deletion"
-            ):
-                continue
+                if notifications.notification_sent_record_exists(
+                    user.user_id, job.uuid, "deletion"
+                ):
+                    continue
 
-            log.info(
-                f"Sending transcription deletion notification to user {user.user_id} for job {job.uuid}."
-            )
+                log.info(
+                    f"Sending transcription deletion notification to user {user.user_id} for job {job.uuid}."
+                )
 
-            notifications.send_job_deleted(user.email)
-            notifications.notification_sent_record_add(
-                user.user_id, job.uuid, "deletion"
-            )
+                if notifications.send_job_deleted(user.email):
+                    sent_records.append((user.user_id, job.uuid, "deletion"))
+        finally:
+            # Record the e-mails queued so far even if the loop fails.
+            notifications.notification_sent_records_add(sent_records)
 
         # Permanently delete all jobs older than ~2 months
         jobs_to_delete = (
@@ -512,32 +516,33 @@ def job_cleanup() -> None:
             )
             session.delete(job)
 
-        for job in jobs_to_notify:
-            user = users_map.get(job.user_id)
+        sent_records = []
 
-            if not user or not user.notifications:
-                continue
+        try:
+            for job in jobs_to_notify:
+                user = users_map.get(job.user_id)
 
-            if "deletion" not in user.notifications.split(","):
-                continue
+                if not user or not user.notifications_bits & NotificationFlag.DELETION:
+                    continue
 
-            if user.email == "":
-                continue
+                if user.email == "":
+                    continue
 
-            if notifications.notification_sent_record_exists(
-                user.user_id, job.uuid, "deletion_warning"
-            ):
-                continue
+                if notifications.notification_sent_record_exists(
+                    user.user_id, job.uuid, "deletion_warning"
+                ):
+                    continue
 
-            log.info(
-                f"Sending transcription deletion warning notification to user {user.user_id} for job {job.uuid}."
-            )
+                log.info(
+                    f"Sending transcription deletion warning notification to user {user.user_id} for job {job.uuid}."
+                )
 
-            # Send the notification
-            notifications.send_job_to_be_deleted(user.email)
-            notifications.notification_sent_record_add(
-                user.user_id, job.uuid, "deletion_warning"
-            )
+                # Send the notification
+                if notifications.send_job_to_be_deleted(user.email):
+                    sent_records.append((user.user_id, job.uuid, "deletion_warning"))
+        finally:
+            # Record the e-mails queued so far even if the loop fails.
+            notifications.notification_sent_records_add(sent_records)
 
     user_purge_deleted()
 
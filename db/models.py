@@ -16,12 +16,12 @@
 # limitations under the License.
 
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import Enum, IntFlag
 from typing import List, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel
-from sqlalchemy import Index
+from sqlalchemy import Index, SmallInteger
 from sqlalchemy.types import Enum as SQLAlchemyEnum
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -162,6 +162,18 @@ class JobType(str, Enum):
     TRANSCRIPTION = "transcription"
 
 
+class NotificationFlag(IntFlag):
+    """
+    Bit flags for the notification preferences of a user.
+    """
+
+    JOB = 1
+    DELETION = 2
+    USER = 4
+    QUOTA = 8
+    WEEKLY_REPORT = 16
+
+
 class JobResult(SQLModel, table=True):
     """
     Model representing the result of a job.
@@ -423,9 +435,11 @@ class User(SQLModel, table=True):
         default=None,
         description="User's email address",
     )
-    notifications: Optional[str] = Field(
-        default=None,
-        description="User's notification preferences",
+    notifications_bits: int = Field(
+        default=0,
+        sa_type=SmallInteger,
+        sa_column_kwargs={"server_default": "0"},
+        description="User's notification preferences as NotificationFlag bits",
     )
     deleted: bool = Field(
         default=False,
@@ -459,7 +473,11 @@ class User(SQLModel, table=True):
             "deleted": self.deleted,
             "manually_activated": self.manually_activated,
             "manually_deactivated": self.manually_deactivated,
-            "notifications": self.notifications,
+            "notifications": "".join(
+                f"{flag.name.lower()},"
+                for flag in NotificationFlag
+                if self.notifications_bits & flag
+            ),
             "private_key": self.private_key,
             "public_key": self.public_key,
             "realm": self.realm,
@@ -15,12 +15,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import re
 
 from contextlib import asynccontextmanager, contextmanager
 from functools import lru_cache
-from sqlalchemy import create_engine, schema
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import create_engine, schema, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 from sqlmodel import SQLModel
 from typing import AsyncGenerator, Generator
@@ -59,6 +65,32 @@ def make_sync_url(url: str) -> str:
     return url
 
 
+def get_pool_options(url: str) -> dict:
+    """
+    Get the connection pool options for an engine.
+
+    SQLite uses SQLAlchemy's default pool, everything else gets a bounded
+    QueuePool sized per worker process.
+
+    Parameters:
+        url (str): The database URL.
+
+    Returns:
+        dict: Keyword arguments for create_engine/create_async_engine.
+    """
+
+    if url.startswith("sqlite"):
+        return {}
+
+    return {
+        "pool_size": settings.API_DATABASE_POOL_SIZE,
+        "max_overflow": settings.API_DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.API_DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.API_DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Sync engine / session  (kept for APScheduler background tasks + Alembic)
 # ---------------------------------------------------------------------------
@@ -73,19 +105,8 @@ def get_sessionmaker() -> sessionmaker:
         sessionmaker: A SQLAlchemy sessionmaker instance.
     """
 
-    if not settings.API_DATABASE_URL.startswith("sqlite"):
-        pool_opts = {
-            "pool_size": 3,       # 3 × 8 = 24 base
-            "max_overflow": 2,    # burst to 5 × 8 = 40 max
-            "pool_timeout": 30,
-            "pool_recycle": 1800,
-            "pool_pre_ping": True,
-        }
-    else:
-        pool_opts = {}
-
     sync_url = make_sync_url(settings.API_DATABASE_URL)
-    engine = create_engine(sync_url, **pool_opts)
+    engine = create_engine(sync_url, **get_pool_options(sync_url))
 
     with engine.connect() as connection:
         if connection.dialect.name != "sqlite":
@@ -125,33 +146,25 @@ def get_session() -> Generator[Session, None, None]:
 # Async engine / session  (used by FastAPI endpoints)
 # ---------------------------------------------------------------------------
 
+_async_engine_instance: AsyncEngine | None = None
 _async_sessionmaker_instance: async_sessionmaker[AsyncSession] | None = None
 
 
-async def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+async def get_async_engine() -> AsyncEngine:
     """
-    Get an async SQLAlchemy sessionmaker (singleton).
+    Get the pooled async SQLAlchemy engine (singleton).
     Cannot use @lru_cache because the first call performs async I/O.
+
+    Returns:
+        AsyncEngine: The async engine shared by all FastAPI endpoints.
     """
 
-    global _async_sessionmaker_instance
-    if _async_sessionmaker_instance is not None:
-        return _async_sessionmaker_instance
+    global _async_engine_instance
+    if _async_engine_instance is not None:
+        return _async_engine_instance
 
     async_url = make_async_url(settings.API_DATABASE_URL)
-
-    if not async_url.startswith("sqlite"):
-        pool_opts = {
-            "pool_size": 3,
-            "max_overflow": 2,
-            "pool_timeout": 30,
-            "pool_recycle": 1800,
-            "pool_pre_ping": True,
-        }
-    else:
-        pool_opts = {}
-
-    engine = create_async_engine(async_url, **pool_opts)
+    engine = create_async_engine(async_url, **get_pool_options(async_url))
 
     async with engine.begin() as conn:
         if not async_url.startswith("sqlite"):
@@ -164,12 +177,74 @@ async def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
 
         await conn.run_sync(SQLModel.metadata.create_all)
 
+    _async_engine_instance = engine
+    return _async_engine_instance
+
+
+async def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Get an async SQLAlchemy sessionmaker (singleton).
+    Cannot use @lru_cache because the first call performs async I/O.
+    """
+
+    global _async_sessionmaker_instance
+    if _async_sessionmaker_instance is not None:
+        return _async_sessionmaker_instance
+
+    engine = await get_async_engine()
+
     _async_sessionmaker_instance = async_sessionmaker(
         engine, class_=AsyncSession, expire_on_commit=False
     )
     return _async_sessionmaker_instance
 
 
+async def database_ping() -> None:
+    """
+    Check database connectivity on a pooled connection from the async engine,
+    without the overhead of setting up an ORM session.
+
+    Returns:
+        None
+    """
+
+    engine = await get_async_engine()
+
+    async with engine.connect() as connection:
+        # PostgreSQL answers an empty query without parsing or planning it,
+        # which is cheaper than SELECT 1 for frequent monitoring probes.
+        if connection.dialect.name == "postgresql":
+            await connection.execute(text(";"))
+        else:
+            await connection.execute(text("SELECT 1"))
+
+
+async def warm_connection_pool(size: int | None = None) -> None:
+    """
+    Open connections in the async pool up front so the first requests after
+    startup do not pay for connection setup.
+
+    Parameters:
+        size (int | None): Number of connections to open, defaults to the
+                           configured pool size.
+
+    Returns:
+        None
+    """
+
+    engine = await get_async_engine()
+
+    if engine.dialect.name == "sqlite":
+        return
+
+    if size is None:
+        size = settings.API_DATABASE_POOL_SIZE
+
+    await asyncio.gather(*(database_ping() for _ in range(size)))
+
+    log.info(f"Warmed up database connection pool with {size} connections.")
+
+
 @asynccontextmanager
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -15,13 +15,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import calendar
 
 from datetime import datetime, timedelta
 from typing import Optional
 
 from auth.client import dn_in_list
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from utils.log import get_logger
 
 from db.models import (
@@ -32,6 +33,7 @@ from db.models import (
     JobResult,
     JobStatusEnum,
     JobType,
+    NotificationFlag,
     User,
 )
 from db.session import get_async_session
@@ -122,15 +124,27 @@ async def notify_new_user_created(user: dict) -> None:
         if not admin["admin"]:
             continue
 
-        if admin_email := await user_get_notifications(admin["user_id"], "user"):
-            if notifications.notification_sent_record_exists(
-                admin["user_id"], user_id, "user_creation"
+        if admin_email := await user_get_notifications(
+            admin["user_id"], NotificationFlag.USER
+        ):
+            # The sent-record helpers use the sync engine, keep them off the
+            # event loop.
+            if await asyncio.to_thread(
+                notifications.notification_sent_record_exists,
+                admin["user_id"],
+                user_id,
+                "user_creation",
             ):
                 continue
 
-            notifications.send_new_user_created(admin_email, username)
-            notifications.notification_sent_record_add(
-                admin["user_id"], user_id, "user_creation"
+            if not notifications.send_new_user_created(admin_email, username):
+                continue
+
+            await asyncio.to_thread(
+                notifications.notification_sent_record_add,
+                admin["user_id"],
+                user_id,
+                "user_creation",
             )
             log.info(f"Sent new user creation notification to admin {admin_email}")
 
@@ -162,7 +176,7 @@ async def user_delete(username: str) -> bool:
         user.encryption_settings = False
         user.private_key = None
         user.public_key = None
-        user.notifications = None
+        user.notifications_bits = 0
 
         # Remove files and job results for the deleted user
         job_result = await session.execute(
@@ -444,7 +458,6 @@ async def user_update(
     encryption_settings: Optional[bool] = None,
     encryption_password: Optional[str] = None,
     reset_encryption: Optional[bool] = False,
-    notifications_str: Optional[str] = None,
     email: Optional[str] = None,
     reset_manual: Optional[bool] = False,
 ) -> dict:
@@ -502,14 +515,20 @@ async def user_update(
                 user.email != ""
                 and user.email is not None
                 and user.active
-                and not notifications.notification_sent_record_exists(
-                    user.user_id, user.user_id, "account_activated"
+                and not await asyncio.to_thread(
+                    notifications.notification_sent_record_exists,
+                    user.user_id,
+                    user.user_id,
+                    "account_activated",
                 )
             ):
-                notifications.notification_send_account_activated(user.email)
-                notifications.notification_sent_record_add(
-                    user.user_id, user.user_id, "account_activated"
-                )
+                if notifications.notification_send_account_activated(user.email):
+                    await asyncio.to_thread(
+                        notifications.notification_sent_record_add,
+                        user.user_id,
+                        user.user_id,
+                        "account_activated",
+                    )
 
         if admin is not None:
             log.info(f"Setting user {user.user_id} admin status to {admin}")
@@ -565,12 +584,6 @@ async def user_update(
             if email != "" and email is not None:
                 notifications.send_email_verification(email)
 
-        if notifications_str is not None:
-            log.info(
-                f"Updating notifications for user {user.user_id} to {notifications_str}"
-            )
-            user.notifications = notifications_str
-
         log.info(
             f"User {user.user_id} updated: "
             + f"transcribed_seconds={user.transcribed_seconds}, "
@@ -963,12 +976,48 @@ async def user_can_transcribe(user_id: str) -> int:
         return 0
 
 
-async def user_get_notifications(user_id: str, notification: str) -> Optional[str]:
+async def user_update_notifications(user_id: str, notifications_bits: int) -> int:
+    """
+    Set a user's notification preferences.
+
+    The update is done in SQL and only matches the row when the bits differ,
+    so saving unchanged preferences does not write a new row version.
+
+    Parameters:
+        user_id (str): The user ID.
+        notifications_bits (int): The NotificationFlag bits to set.
+
+    Returns:
+        int: The number of rows updated, 0 if the preferences were unchanged.
+    """
+
+    notifications_bits = int(notifications_bits)
+
+    async with get_async_session() as session:
+        result = await session.execute(
+            update(User)
+            .where(
+                User.user_id == user_id,
+                User.notifications_bits != notifications_bits,
+            )
+            .values(notifications_bits=notifications_bits)
+        )
+
+    if result.rowcount:
+        log.info(f"Updating notifications for user {user_id} to {notifications_bits}")
+
+    return result.rowcount
+
+
+async def user_get_notifications(
+    user_id: str, notification: NotificationFlag
+) -> Optional[str]:
     """
     Get a user's notification settings by user_id.
 
     Parameters:
         user_id (str): The user ID.
+        notification (NotificationFlag): The notification to check for.
 
     Returns:
         Optional[str]: The email associated with the user_id if the notification
@@ -981,10 +1030,7 @@ async def user_get_notifications(user_id: str, notification: str) -> Optional[st
         )
         user = result.scalars().first()
 
-        if not user.notifications:
-            return None
-
-        if notification in user.notifications.split(","):
+        if user.notifications_bits & notification:
             return user.email
 
         return None
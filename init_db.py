@@ -29,18 +29,6 @@ from urllib.parse import urlparse
 from sqlalchemy import create_engine, schema, text
 from sqlmodel import SQLModel
 
-# Import all models to register them with SQLModel.metadata
-from db.models import (
-    Job,
-    JobResult,
-    User,
-    Group,
-    GroupUserLink,
-    GroupModelLink,
-    Model,
-    Customer,
-    NotificationsSent,
-)
 from utils.settings import get_settings
 
 
@@ -90,15 +78,17 @@ def init_database():
         # Create schema if needed (for PostgreSQL)
         with engine.connect() as connection:
             if connection.dialect.name != "sqlite":
-                if connection.dialect.has_schema(connection, "transcribe"):
-                    print("Schema 'transcribe' already exists")
-                else:
-                    try:
-                        connection.execute(schema.CreateSchema("transcribe"))
-                        connection.commit()
-                        print("Created schema 'transcribe'")
-                    except Exception as e:
-                        print(f"Schema creation skipped: {e}")
+                try:
+                    connection.execute(
+                        schema.CreateSchema("transcribe", if_not_exists=True)
+                    )
+                    connection.commit()
+                    print("Schema 'transcribe' is in place")
+                except Exception as e:
+                    print(f"Schema creation skipped: {e}")
+
+        # Import all models to register them with SQLModel.metadata
+        import db.models  # noqa: F401
 
         # Create all tables
         print("Creating database tables...")
@@ -15,27 +15,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import orjson
 import time
 
 from auth.client import verify_client_dn
 from auth.oidc import get_current_admin_user
-from db.session import get_async_session
+from db.session import database_ping
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
-from sqlalchemy import text
+from fastapi.responses import ORJSONResponse
 from utils.health import HealthStatus
 from utils.log import get_logger
 
 log = get_logger()
-router = APIRouter(tags=["healthcheck"])
+router = APIRouter(tags=["healthcheck"], default_response_class=ORJSONResponse)
 health = HealthStatus()
 
+# Upper bound for the database ping in /status, a stuck database must not
+# hang the monitoring endpoint.
+DATABASE_PING_TIMEOUT = 2
+
 
 @router.post("/healthcheck", include_in_schema=False)
 async def healthcheck(
     request: Request,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Recevice a JSON blob with system data from the GPU workers.
 
@@ -43,21 +48,23 @@ async def healthcheck(
         request (Request): The incoming HTTP request.
 
     Returns:
-        JSONResponse: The result of the health check.
+        ORJSONResponse: The result of the health check.
     """
 
-    data = await request.json()
+    # Workers post sizeable stats payloads every few seconds, parse them
+    # with orjson rather than the stdlib json used by request.json().
+    data = orjson.loads(await request.body())
 
     health.add(data)
 
-    return JSONResponse(content={"result": "ok"})
+    return ORJSONResponse(content={"result": "ok"})
 
 
 @router.get("/healthcheck", include_in_schema=False)
 async def get_healthcheck(
     request: Request,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get the health status of all workers.
 
@@ -66,29 +73,29 @@ async def get_healthcheck(
         user_id (str): The ID of the user.
 
     Returns:
-        JSONResponse: The health status of all workers.
+        ORJSONResponse: The health status of all workers.
     """
 
     if not admin_user["bofh"]:
         log.warning(f"Non-BOFH user {admin_user['user_id']} denied access to healthcheck")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "User not authorized"},
             status_code=403,
         )
 
     data = health.get()
 
-    return JSONResponse(content={"result": data})
+    return ORJSONResponse(content={"result": data})
 
 
 @router.get("/status")
-async def get_status() -> JSONResponse:
+async def get_status() -> ORJSONResponse:
     """
     Public status endpoint to check if backend, database, and workers are working.
     No authentication required - intended for monitoring tools.
 
     Returns:
-        JSONResponse: Status of backend, database, and worker connectivity.
+        ORJSONResponse: Status of backend, database, and worker connectivity.
     """
 
     status = {
@@ -98,38 +105,43 @@ async def get_status() -> JSONResponse:
         "workers_online": 0,
     }
 
-    # Check database connectivity
-    try:
-        async with get_async_session() as session:
-            await session.execute(text("SELECT 1"))
-    except Exception:
+    # Check database connectivity and fetch worker stats concurrently, the
+    # worker stats are read with a blocking query so run it in a thread.
+    ping, worker_data = await asyncio.gather(
+        asyncio.wait_for(database_ping(), timeout=DATABASE_PING_TIMEOUT),
+        asyncio.to_thread(health.latest),
+        return_exceptions=True,
+    )
+
+    if isinstance(ping, BaseException):
         status["database"] = "error"
 
+    if isinstance(worker_data, BaseException):
+        log.error(f"Failed to get worker health: {worker_data}")
+        worker_data = {}
+
     # Check worker status - worker is online if seen within last 2 minutes
     now = time.time()
-    online_count = 0
-    worker_data = health.get()
 
     workers_detail = {}
-    for idx, (worker_id, stats) in enumerate(worker_data.items()):
-        if stats:
-            last_seen = stats[-1].get("seen", 0)
-            if now - last_seen < 120:
-                online_count += 1
-                gpu = stats[-1].get("gpu_usage", 0)
-                if isinstance(gpu, list):
-                    gpu = max((g.get("utilization", 0) for g in gpu if isinstance(g, dict)), default=0)
-                elif isinstance(gpu, dict):
-                    gpu = gpu.get("utilization", 0)
-                workers_detail[f"worker-{idx}"] = {"busy": gpu > 0}
-
-    status["workers_online"] = online_count
+    for idx, latest in enumerate(worker_data.values()):
+        if now - latest["seen"] >= 120:
+            continue
+
+        gpu = latest.get("gpu_usage", 0)
+        if isinstance(gpu, list):
+            gpu = max((g.get("utilization", 0) for g in gpu if isinstance(g, dict)), default=0)
+        elif isinstance(gpu, dict):
+            gpu = gpu.get("utilization", 0)
+        workers_detail[f"worker-{idx}"] = {"busy": gpu > 0}
+
+    status["workers_online"] = len(workers_detail)
     status["workers_detail"] = workers_detail
-    if online_count > 0:
+    if workers_detail:
         status["workers"] = "ok"
 
     # Determine overall status (workers not critical for basic health)
     core_ok = status["backend"] == "ok" and status["database"] == "ok"
     status_code = 200 if core_ok else 503
 
-    return JSONResponse(content=status, status_code=status_code)
+    return ORJSONResponse(content=status, status_code=status_code)
@@ -35,7 +35,7 @@ from db.user import (
     user_update,
     user_get_notifications,
 )
-from db.models import JobStatusEnum
+from db.models import JobStatusEnum, NotificationFlag
 from pathlib import Path
 from utils.log import get_logger
 from utils.settings import get_settings
@@ -103,10 +103,10 @@ async def update_transcription_status(
                 content={"result": {"error": "User not found"}}, status_code=404
             )
 
-        if email := await user_get_notifications(user_id, "job"):
+        if email := await user_get_notifications(user_id, NotificationFlag.JOB):
             notifications.send_transcription_finished(email)
     elif job["status"] == JobStatusEnum.FAILED:
-        if email := await user_get_notifications(user_id, "job"):
+        if email := await user_get_notifications(user_id, NotificationFlag.JOB):
             notifications.send_transcription_failed(email)
 
     # We don't want to keep files for failed or completed jobs
@@ -17,9 +17,11 @@
 
 from auth.oidc import get_current_user
 from db.announcement import announcement_get_active
+from db.models import NotificationFlag
 from db.user import (
     user_get_private_key,
     user_update,
+    user_update_notifications,
 )
 
 from fastapi import APIRouter, Depends, Request
@@ -35,6 +37,15 @@ settings = get_settings()
 
 api_file_storage_dir = settings.API_FILE_STORAGE_DIR
 
+# Notification settings attribute and the flag stored for it on the user.
+NOTIFICATION_FLAGS = (
+    ("notify_on_job", NotificationFlag.JOB),
+    ("notify_on_deletion", NotificationFlag.DELETION),
+    ("notify_on_user", NotificationFlag.USER),
+    ("notify_on_quota", NotificationFlag.QUOTA),
+    ("notify_on_weekly_report", NotificationFlag.WEEKLY_REPORT),
+)
+
 
 @router.get("/me")
 async def get_user_info(
@@ -99,35 +110,13 @@ async def set_user_info(
     elif item.email is not None:
         await user_update(user["user_id"], email=item.email)
     elif item.notifications:
-        notifications_str = ""
-
-        if (
-            item.notifications.notify_on_job is not None
-            and item.notifications.notify_on_job
-        ):
-            notifications_str += "job,"
-        if (
-            item.notifications.notify_on_deletion is not None
-            and item.notifications.notify_on_deletion
-        ):
-            notifications_str += "deletion,"
-        if (
-            item.notifications.notify_on_user is not None
-            and item.notifications.notify_on_user
-        ):
-            notifications_str += "user,"
-        if (
-            item.notifications.notify_on_quota is not None
-            and item.notifications.notify_on_quota
-        ):
-            notifications_str += "quota,"
-        if (
-            item.notifications.notify_on_weekly_report is not None
-            and item.notifications.notify_on_weekly_report
-        ):
-            notifications_str += "weekly_report,"
-
-        await user_update(user["user_id"], notifications_str=notifications_str)
+        notifications_bits = NotificationFlag(0)
+
+        for attr, flag in NOTIFICATION_FLAGS:
+            if getattr(item.notifications, attr):
+                notifications_bits |= flag
+
+        await user_update_notifications(user["user_id"], notifications_bits)
 
     return JSONResponse(content={"result": {"status": "OK"}})
 
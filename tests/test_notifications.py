@@ -0,0 +1,102 @@
+# Copyright (c) 2025-2026 Sunet.
+# Contributor: Kristofer Hallin
+#
+# This file is part of Sunet Scribe.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import tempfile
+
+os.environ.setdefault("OIDC_SCOPE", "openid")
+os.environ.setdefault("API_FILE_STORAGE_DIR", tempfile.gettempdir())
+
+import utils.notifications  # noqa: E402
+
+
+class FakeSMTP:
+    """
+    Stand-in for smtplib.SMTP that records the recipients of sent e-mail.
+    """
+
+    sent = []
+
+    def __init__(self, host, port):
+        pass
+
+    def starttls(self, context=None):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def sendmail(self, sender, to_emails, msg):
+        FakeSMTP.sent.append(to_emails)
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_bad_header_does_not_stop_worker(monkeypatch):
+    monkeypatch.setattr(utils.notifications.smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(FakeSMTP, "sent", [])
+
+    for key in ("API_SMTP_HOST", "API_SMTP_USERNAME", "API_SMTP_PASSWORD"):
+        monkeypatch.setattr(utils.notifications.settings, key, "test")
+
+    async def run():
+        notifications = utils.notifications.Notifications()
+        notifications.start()
+
+        # A linefeed in a header makes EmailMessage raise ValueError.
+        notifications.add(["bad@example.com"], "bad\nsubject", "message")
+        notifications.add(["good@example.com"], "subject", "message")
+
+        for _ in range(100):
+            if FakeSMTP.sent:
+                break
+            await asyncio.sleep(0.05)
+
+        await notifications.stop()
+
+    asyncio.run(run())
+
+    assert FakeSMTP.sent == [["good@example.com"]]
+
+
+def test_stop_sends_queued_email(monkeypatch):
+    monkeypatch.setattr(utils.notifications.smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(FakeSMTP, "sent", [])
+
+    for key in ("API_SMTP_HOST", "API_SMTP_USERNAME", "API_SMTP_PASSWORD"):
+        monkeypatch.setattr(utils.notifications.settings, key, "test")
+
+    async def run():
+        notifications = utils.notifications.Notifications()
+        notifications.start()
+
+        for i in range(5):
+            notifications.add([f"user{i}@example.com"], "subject", "message")
+
+        await notifications.stop()
+
+        # Dropped, the worker is no longer running.
+        notifications.add(["late@example.com"], "subject", "message")
+
+    asyncio.run(run())
+
+    assert FakeSMTP.sent == [[f"user{i}@example.com"] for i in range(5)]
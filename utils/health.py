@@ -20,11 +20,14 @@ import time
 
 from db.models import WorkerHealth
 from db.session import get_session
-from sqlalchemy import func
+from sqlalchemy import and_, func, select
 
 
 MAX_ENTRIES_PER_WORKER = 300
 
+# Seconds a result from get() is reused, /status is polled often by monitors.
+CACHE_TTL = 1.0
+
 
 class HealthStatus:
     """
@@ -32,6 +35,12 @@ class HealthStatus:
     usage, and last seen timestamp for each worker in PostgreSQL.
     """
 
+    def __init__(self) -> None:
+        self._cached: dict | None = None
+        self._cached_at = 0.0
+        self._latest: dict | None = None
+        self._latest_at = 0.0
+
     def add(self, data):
         """
         Add a new health status entry for a worker.
@@ -75,14 +84,23 @@ class HealthStatus:
                     WorkerHealth.id.in_(oldest_ids.select())
                 ).delete(synchronize_session=False)
 
+        self._cached = None
+        self._latest = None
+
     def get(self):
         """
-        Get the health status of all workers.
+        Get the health status of all workers. The result is cached for
+        CACHE_TTL seconds.
 
         Returns:
             dict: A dictionary containing the health status of all workers.
         """
 
+        now = time.monotonic()
+
+        if self._cached is not None and now - self._cached_at < CACHE_TTL:
+            return self._cached
+
         result = {}
 
         with get_session() as session:
@@ -96,22 +114,81 @@ class HealthStatus:
                 if entry.worker_id not in result:
                     result[entry.worker_id] = []
 
-                gpu_usage = entry.gpu_usage
-                if gpu_usage is not None:
-                    try:
-                        gpu_usage = json.loads(gpu_usage)
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-
-                result[entry.worker_id].append(
-                    {
-                        "load_avg": entry.load_avg,
-                        "memory_usage": entry.memory_usage,
-                        "gpu_usage": gpu_usage,
-                        "seen": entry.created_at.timestamp()
-                        if entry.created_at
-                        else time.time(),
-                    }
+                result[entry.worker_id].append(self._entry_as_dict(entry))
+
+        self._cached = dict(sorted(result.items()))
+        self._cached_at = now
+
+        return self._cached
+
+    def latest(self):
+        """
+        Get the most recent health status entry of each worker. Only the
+        newest row per worker is read, so this stays cheap regardless of
+        MAX_ENTRIES_PER_WORKER. The result is cached for CACHE_TTL seconds.
+
+        Returns:
+            dict: A dictionary mapping worker_id to its latest entry.
+        """
+
+        now = time.monotonic()
+
+        if self._latest is not None and now - self._latest_at < CACHE_TTL:
+            return self._latest
+
+        last_seen = (
+            select(
+                WorkerHealth.worker_id,
+                func.max(WorkerHealth.created_at).label("created_at"),
+            )
+            .group_by(WorkerHealth.worker_id)
+            .subquery()
+        )
+
+        with get_session() as session:
+            entries = (
+                session.query(WorkerHealth)
+                .join(
+                    last_seen,
+                    and_(
+                        WorkerHealth.worker_id == last_seen.c.worker_id,
+                        WorkerHealth.created_at == last_seen.c.created_at,
+                    ),
                 )
+                .order_by(WorkerHealth.worker_id)
+                .all()
+            )
+
+            self._latest = {
+                entry.worker_id: self._entry_as_dict(entry) for entry in entries
+            }
+
+        self._latest_at = now
+
+        return self._latest
+
+    @staticmethod
+    def _entry_as_dict(entry: WorkerHealth) -> dict:
+        """
+        Convert a WorkerHealth row to the dictionary format returned by the API.
+
+        Parameters:
+            entry (WorkerHealth): The health status entry.
+
+        Returns:
+            dict: The entry as a dictionary.
+        """
 
-        return dict(sorted(result.items()))
+        gpu_usage = entry.gpu_usage
+        if gpu_usage is not None:
+            try:
+                gpu_usage = json.loads(gpu_usage)
+            except (json.JSONDecodeError, TypeError):
+                pass
+
+        return {
+            "load_avg": entry.load_avg,
+            "memory_usage": entry.memory_usage,
+            "gpu_usage": gpu_usage,
+            "seen": entry.created_at.timestamp() if entry.created_at else time.time(),
+        }
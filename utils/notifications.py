@@ -15,56 +15,210 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import collections
+import asyncio
+import functools
 import smtplib
 import ssl
-import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from email.message import EmailMessage
 
 from db.models import NotificationsSent
 from db.session import get_session
+from sqlalchemy import insert, select
 from utils.log import get_logger
 from utils.settings import get_settings
 
 logger = get_logger()
 settings = get_settings()
 
+# Close the SMTP connection after this many seconds without queued e-mail.
+SMTP_IDLE_TIMEOUT = 60
+
+# TLS context for STARTTLS, built once so the CA bundle is not re-read for
+# every SMTP connection.
+SSL_CONTEXT = ssl.create_default_context()
+
+# Seconds a background thread waits for room in a full queue before the
+# e-mail is dropped.
+QUEUE_PUT_TIMEOUT = 60
+
+# Seconds stop() waits for queued e-mail to be sent before dropping the rest.
+QUEUE_DRAIN_TIMEOUT = 30
+
+# (subject, message) templates and the branding values they share, resolved
+# once at import time instead of on every send.
+TEMPLATES = {
+    name: (template["subject"], template["message"])
+    for name, template in (
+        ("updated", settings.NOTIFICATION_MAIL_UPDATED),
+        ("transcription_finished", settings.NOTIFICATION_MAIL_TRANSCRIPTION_FINISHED),
+        ("transcription_failed", settings.NOTIFICATION_MAIL_TRANSCRIPTION_FAILED),
+        ("transcription_deleted", settings.NOTIFICATION_MAIL_TRANSCRIPTION_DELETED),
+        (
+            "transcription_to_be_deleted",
+            settings.NOTIFICATION_MAIL_TRANSCRIPTION_TO_BE_DELETED,
+        ),
+        ("new_user_created", settings.NOTIFICATION_MAIL_NEW_USER_CREATED),
+        ("account_activated", settings.NOTIFICATION_MAIL_ACCOUNT_ACTIVATED),
+        ("quota_alert", settings.NOTIFICATION_MAIL_QUOTA_ALERT),
+        ("group_quota_alert", settings.NOTIFICATION_MAIL_GROUP_QUOTA_ALERT),
+        ("weekly_usage_report", settings.NOTIFICATION_MAIL_WEEKLY_USAGE_REPORT),
+    )
+}
+
+BRANDING = {
+    "branding_name": settings.BRANDING_NAME,
+    "branding_frontend_url": settings.BRANDING_FRONTEND_URL,
+    "branding_admin_url": settings.BRANDING_ADMIN_URL,
+}
+
 
 class Notifications:
     def __init__(self) -> None:
         """
         Initialize the Notifications system.
 
-        Starts a background thread that processes the email notification queue
+        The e-mail queue is processed by a background task on the event loop,
+        which is started with start() when the application starts up. All
+        SMTP calls run on a single thread, so the shared connection is never
+        used by two threads at once.
+
+        Returns:
+            None
+        """
+
+        self.__queue: asyncio.Queue | None = None
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__worker: asyncio.Task | None = None
+        self.__smtp: smtplib.SMTP | None = None
+        self.__smtp_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="notifications-smtp"
+        )
+
+    def start(self) -> None:
+        """
+        Start the background task that sends queued e-mail notifications.
+        Must be called from the running event loop.
+
+        Returns:
+            None
+        """
+
+        self.__loop = asyncio.get_running_loop()
+        self.__queue = asyncio.Queue(maxsize=settings.NOTIFICATION_QUEUE_MAX)
+        self.__worker = self.__loop.create_task(self.__process_queue(self.__queue))
+
+    async def stop(self) -> None:
+        """
+        Stop the background task that sends queued e-mail notifications.
+        E-mail already in the queue is sent first, for at most
+        QUEUE_DRAIN_TIMEOUT seconds.
+
+        Returns:
+            None
+        """
+
+        queue = self.__queue
+
+        # Let add() take the "worker is not running" path from here on.
+        self.__queue = None
+        self.__loop = None
+
+        if self.__worker is None:
+            return
+
+        if queue is not None and not self.__worker.done():
+            try:
+                await asyncio.wait_for(queue.join(), timeout=QUEUE_DRAIN_TIMEOUT)
+            except TimeoutError:
+                logger.error(
+                    "Notification queue not drained on shutdown, "
+                    + f"{queue.qsize()} email notifications dropped."
+                )
+
+        self.__worker.cancel()
+
+        try:
+            await self.__worker
+        except asyncio.CancelledError:
+            pass
+
+        self.__worker = None
+
+        # Queued behind a send that may still be running on the SMTP thread.
+        await self.__run_smtp(self.__smtp_disconnect)
+
+    async def __run_smtp(self, func, *args, **kwargs) -> None:
+        """
+        Run a blocking SMTP call on the dedicated SMTP thread.
+
+        Parameters:
+            func (callable): The function to run.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
 
         Returns:
             None
         """
 
-        self.__queue = collections.deque()
+        await asyncio.get_running_loop().run_in_executor(
+            self.__smtp_executor, functools.partial(func, *args, **kwargs)
+        )
 
-        def handler() -> None:
-            threading.Timer(3.0, handler).start()
+    async def __process_queue(self, queue: asyncio.Queue) -> None:
+        """
+        Send queued e-mail notifications as they arrive. Bursts of e-mail
+        share one SMTP connection, which is closed again when the queue has
+        been idle for SMTP_IDLE_TIMEOUT seconds.
 
-            while len(self.__queue) > 0:
-                notification = self.__queue.popleft()
+        Parameters:
+            queue (asyncio.Queue): The queue to process, kept even after
+                                   stop() has detached it from add().
 
+        Returns:
+            None
+        """
+
+        while True:
+            try:
+                notification = await asyncio.wait_for(
+                    queue.get(), timeout=SMTP_IDLE_TIMEOUT
+                )
+            except TimeoutError:
+                await self.__run_smtp(self.__smtp_disconnect)
+                continue
+
+            try:
                 if (
                     settings.API_SMTP_HOST
                     and settings.API_SMTP_USERNAME
                     and settings.API_SMTP_PASSWORD
                 ):
-                    self.__notification_send_email(
+                    await self.__run_smtp(
+                        self.__notification_send_email,
                         to_emails=notification["to_emails"],
                         subject=notification["subject"],
                         message=notification["message"],
                     )
-
-        handler()
-
-    def add(self, to_emails: list, subject: str, message: str) -> None:
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep the worker alive, it is the only one sending e-mail.
+                logger.error(f"Error processing email notification: {e}")
+            finally:
+                queue.task_done()
+
+    def add(self, to_emails: list, subject: str, message: str) -> bool:
         """
         Queue an email notification to be sent later.
+        Safe to call both from the event loop and from background threads.
+        Background threads block while the queue is full, on the event loop
+        the notification is dropped instead.
+
+        Delivery is at most once: a queued e-mail is not retried if sending
+        fails, and e-mail still queued when stop() times out is dropped.
+        Callers that record a notification as sent should only do so when
+        this returns True.
 
         Parameters:
             to_emails (list): List of recipient email addresses.
@@ -72,23 +226,147 @@ class Notifications:
             message (str): The body of the email.
 
         Returns:
-            None
+            bool: True if the e-mail was queued, False if it was dropped.
         """
 
         if not settings.API_SMTP_HOST:
             logger.warning(
                 "SMTP host is not configured. Email notifications will not be sent."
             )
-            return
+            return False
+
+        # stop() may clear these from another thread, read them only once.
+        queue, loop, worker = self.__queue, self.__loop, self.__worker
 
-        self.__queue.append(
-            {
-                "to_emails": to_emails,
-                "subject": subject,
-                "message": message,
-            }
+        if queue is None or loop is None or worker is None or worker.done():
+            logger.warning(
+                "Notification worker is not running. Email notification dropped."
+            )
+            return False
+
+        notification = {
+            "to_emails": to_emails,
+            "subject": subject,
+            "message": message,
+        }
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            try:
+                queue.put_nowait(notification)
+            except asyncio.QueueFull:
+                logger.error("Notification queue is full. Email notification dropped.")
+                return False
+
+            return True
+
+        put = queue.put(notification)
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(put, loop)
+        except RuntimeError:
+            # The event loop has been closed.
+            put.close()
+            logger.warning(
+                "Notification worker is not running. Email notification dropped."
+            )
+            return False
+
+        try:
+            future.result(timeout=QUEUE_PUT_TIMEOUT)
+        except TimeoutError:
+            future.cancel()
+            logger.error("Notification queue is full. Email notification dropped.")
+            return False
+        except CancelledError:
+            logger.warning(
+                "Notification worker is not running. Email notification dropped."
+            )
+            return False
+
+        return True
+
+    def __add_template(self, to_email: str, template: str, **values) -> bool:
+        """
+        Queue an email notification rendered from one of the TEMPLATES.
+
+        Parameters:
+            to_email (str): The recipient's email address.
+            template (str): The name of the template in TEMPLATES.
+            **values: Values for the template placeholders, in addition to
+                      the BRANDING values.
+
+        Returns:
+            bool: True if the e-mail was queued.
+        """
+
+        subject, message = TEMPLATES[template]
+        values = BRANDING | values
+
+        return self.add(
+            to_emails=[to_email],
+            subject=subject.format_map(values),
+            message=message.format_map(values),
         )
 
+    def __smtp_connect(self) -> smtplib.SMTP:
+        """
+        Open an authenticated SMTP connection.
+
+        Returns:
+            smtplib.SMTP: The connected SMTP client.
+        """
+
+        server = smtplib.SMTP(settings.API_SMTP_HOST, settings.API_SMTP_PORT)
+        server.starttls(context=SSL_CONTEXT)
+        server.login(settings.API_SMTP_USERNAME, settings.API_SMTP_PASSWORD)
+
+        return server
+
+    def __smtp_disconnect(self) -> None:
+        """
+        Close the SMTP connection if one is open.
+
+        Returns:
+            None
+        """
+
+        if self.__smtp is None:
+            return
+
+        try:
+            self.__smtp.quit()
+        except Exception:
+            self.__smtp.close()
+
+        self.__smtp = None
+
+    def __smtp_sendmail(self, to_email: str, msg: EmailMessage) -> None:
+        """
+        Send a message on the persistent SMTP connection, reconnecting once if
+        the server has dropped it.
+
+        Parameters:
+            to_email (str): The recipient's email address.
+            msg (EmailMessage): The message to send.
+
+        Returns:
+            None
+        """
+
+        if self.__smtp is None:
+            self.__smtp = self.__smtp_connect()
+
+        try:
+            self.__smtp.sendmail(settings.API_SMTP_SENDER, [to_email], msg.as_string())
+        except smtplib.SMTPServerDisconnected:
+            self.__smtp = self.__smtp_connect()
+            self.__smtp.sendmail(settings.API_SMTP_SENDER, [to_email], msg.as_string())
+
     def __notification_send_email(
         self, to_emails: list, subject: str, message: str
     ) -> None:
@@ -104,24 +382,21 @@ class Notifications:
             None
         """
 
-        try:
-            context = ssl.create_default_context()
-            server = smtplib.SMTP(settings.API_SMTP_HOST, settings.API_SMTP_PORT)
-            server.starttls(context=context)
-            server.login(settings.API_SMTP_USERNAME, settings.API_SMTP_PASSWORD)
-
-            for email in to_emails:
+        for email in to_emails:
+            try:
                 msg = EmailMessage()
                 msg["From"] = f"{settings.BRANDING_NAME} <{settings.API_SMTP_SENDER}>"
                 msg["To"] = email
                 msg["Subject"] = subject
                 msg.set_content(message)
-                server.sendmail(settings.API_SMTP_SENDER, [email], msg.as_string())
+
+                self.__smtp_sendmail(email, msg)
                 logger.info("E-mail notification sent.")
-        except Exception as e:
-            logger.error(f"Error sending email: {e}")
+            except Exception as e:
+                logger.error(f"Error sending email: {e}")
+                self.__smtp_disconnect()
 
-    def send_email_verification(self, to_email: str) -> None:
+    def send_email_verification(self, to_email: str) -> bool:
         """
         Send an email verification notification.
 
@@ -129,18 +404,12 @@ class Notifications:
             to_email (str): The recipient's email address.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_UPDATED["subject"],
-            message=settings.NOTIFICATION_MAIL_UPDATED["message"].format(
-                branding_name=settings.BRANDING_NAME
-            ),
-        )
+        return self.__add_template(to_email, "updated")
 
-    def send_transcription_finished(self, to_email: str) -> None:
+    def send_transcription_finished(self, to_email: str) -> bool:
         """
         Send a transcription finished notification.
 
@@ -148,21 +417,12 @@ class Notifications:
             to_email (str): The recipient's email address.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_TRANSCRIPTION_FINISHED["subject"].format(
-                branding_name=settings.BRANDING_NAME,
-            ),
-            message=settings.NOTIFICATION_MAIL_TRANSCRIPTION_FINISHED["message"].format(
-                branding_name=settings.BRANDING_NAME,
-                branding_frontend_url=settings.BRANDING_FRONTEND_URL,
-            ),
-        )
+        return self.__add_template(to_email, "transcription_finished")
 
-    def send_transcription_failed(self, to_email: str) -> None:
+    def send_transcription_failed(self, to_email: str) -> bool:
         """
         Send a transcription failed notification.
 
@@ -170,18 +430,12 @@ class Notifications:
             to_email (str): The recipient's email address.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_TRANSCRIPTION_FAILED["subject"],
-            message=settings.NOTIFICATION_MAIL_TRANSCRIPTION_FAILED["message"].format(
-                branding_name=settings.BRANDING_NAME,
-            ),
-        )
+        return self.__add_template(to_email, "transcription_failed")
 
-    def send_job_deleted(self, to_email: str) -> None:
+    def send_job_deleted(self, to_email: str) -> bool:
         """
         Send a job deleted notification.
 
@@ -189,18 +443,12 @@ class Notifications:
             to_email (str): The recipient's email address.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_TRANSCRIPTION_DELETED["subject"],
-            message=settings.NOTIFICATION_MAIL_TRANSCRIPTION_DELETED["message"].format(
-                branding_name=settings.BRANDING_NAME,
-            ),
-        )
+        return self.__add_template(to_email, "transcription_deleted")
 
-    def send_job_to_be_deleted(self, to_email: str) -> None:
+    def send_job_to_be_deleted(self, to_email: str) -> bool:
         """
         Send a job to be deleted notification.
 
@@ -208,20 +456,12 @@ class Notifications:
             to_email (str): The recipient's email address.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_TRANSCRIPTION_TO_BE_DELETED["subject"],
-            message=settings.NOTIFICATION_MAIL_TRANSCRIPTION_TO_BE_DELETED[
-                "message"
-            ].format(
-                branding_name=settings.BRANDING_NAME,
-            ),
-        )
+        return self.__add_template(to_email, "transcription_to_be_deleted")
 
-    def send_new_user_created(self, to_email: str, username: str) -> None:
+    def send_new_user_created(self, to_email: str, username: str) -> bool:
         """
         Send a new user created notification to the admin.
 
@@ -229,17 +469,13 @@ class Notifications:
             to_email (str): The recipient's email address.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_NEW_USER_CREATED["subject"],
-            message=settings.NOTIFICATION_MAIL_NEW_USER_CREATED["message"].format(
-                username=username,
-                branding_name=settings.BRANDING_NAME,
-                branding_admin_url=settings.BRANDING_ADMIN_URL,
-            ),
+        return self.__add_template(
+            to_email,
+            "new_user_created",
+            username=username,
         )
 
     def notification_sent_record_add(
@@ -266,6 +502,37 @@ class Notifications:
             session.add(notification)
             session.commit()
 
+    def notification_sent_records_add(
+        self, records: list[tuple[str, str, str]]
+    ) -> None:
+        """
+        Record several sent notifications in one multi-row insert.
+        Only use this when none of the records need to be visible to
+        notification_sent_record_exists() before the batch is written.
+
+        Parameters:
+            records (list): (user_id, uuid, notification_type) tuples.
+
+        Returns:
+            None
+        """
+
+        if not records:
+            return
+
+        with get_session() as session:
+            session.execute(
+                insert(NotificationsSent),
+                [
+                    {
+                        "user_id": user_id,
+                        "uuid": uuid,
+                        "notification_type": notification_type,
+                    }
+                    for user_id, uuid, notification_type in records
+                ],
+            )
+
     def notification_sent_record_exists(
         self, user_id: str, uuid: str, notification_type: str
     ) -> bool:
@@ -282,19 +549,19 @@ class Notifications:
         """
 
         with get_session() as session:
-            record = (
-                session.query(NotificationsSent)
-                .filter_by(
-                    user_id=user_id,
-                    uuid=uuid,
-                    notification_type=notification_type,
+            record_id = session.scalar(
+                select(NotificationsSent.id)
+                .where(
+                    NotificationsSent.user_id == user_id,
+                    NotificationsSent.uuid == uuid,
+                    NotificationsSent.notification_type == notification_type,
                 )
-                .first()
+                .limit(1)
             )
 
-            return record is not None
+            return record_id is not None
 
-    def notification_send_account_activated(self, to_email: str) -> None:
+    def notification_send_account_activated(self, to_email: str) -> bool:
         """
         Send an account activated notification.
 
@@ -302,18 +569,10 @@ class Notifications:
             to_email (str): The recipient's email address.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_ACCOUNT_ACTIVATED["subject"].format(
-                branding_name=settings.BRANDING_NAME,
-            ),
-            message=settings.NOTIFICATION_MAIL_ACCOUNT_ACTIVATED["message"].format(
-                branding_name=settings.BRANDING_NAME,
-            ),
-        )
+        return self.__add_template(to_email, "account_activated")
 
     def send_quota_alert(
         self,
@@ -324,7 +583,7 @@ class Notifications:
         minutes_included: int,
         minutes_consumed: int,
         remaining_minutes: int,
-    ) -> None:
+    ) -> bool:
         """
         Send a quota alert notification to an admin.
 
@@ -338,20 +597,18 @@ class Notifications:
             remaining_minutes (int): Minutes remaining.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_QUOTA_ALERT["subject"],
-            message=settings.NOTIFICATION_MAIL_QUOTA_ALERT["message"].format(
-                customer_name=customer_name,
-                usage_percent=usage_percent,
-                blocks_purchased=blocks_purchased,
-                minutes_included=minutes_included,
-                minutes_consumed=minutes_consumed,
-                remaining_minutes=remaining_minutes,
-            ),
+        return self.__add_template(
+            to_email,
+            "quota_alert",
+            customer_name=customer_name,
+            usage_percent=usage_percent,
+            blocks_purchased=blocks_purchased,
+            minutes_included=minutes_included,
+            minutes_consumed=minutes_consumed,
+            remaining_minutes=remaining_minutes,
         )
 
     def send_group_quota_alert(
@@ -362,7 +619,7 @@ class Notifications:
         quota_minutes: int,
         used_minutes: int,
         remaining_minutes: int,
-    ) -> None:
+    ) -> bool:
         """
         Send a group quota alert notification to an admin.
 
@@ -375,19 +632,17 @@ class Notifications:
             remaining_minutes (int): Minutes remaining.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_GROUP_QUOTA_ALERT["subject"],
-            message=settings.NOTIFICATION_MAIL_GROUP_QUOTA_ALERT["message"].format(
-                group_name=group_name,
-                usage_percent=usage_percent,
-                quota_minutes=quota_minutes,
-                used_minutes=used_minutes,
-                remaining_minutes=remaining_minutes,
-            ),
+        return self.__add_template(
+            to_email,
+            "group_quota_alert",
+            group_name=group_name,
+            usage_percent=usage_percent,
+            quota_minutes=quota_minutes,
+            used_minutes=used_minutes,
+            remaining_minutes=remaining_minutes,
         )
 
     def send_weekly_usage_report(
@@ -403,7 +658,7 @@ class Notifications:
         minutes_included: int,
         remaining_minutes: int,
         overage_minutes: int,
-    ) -> None:
+    ) -> bool:
         """
         Send a weekly usage report notification to an admin.
 
@@ -421,24 +676,22 @@ class Notifications:
             overage_minutes (int): Overage minutes.
 
         Returns:
-            None
+            bool: True if the e-mail was queued.
         """
 
-        self.add(
-            to_emails=[to_email],
-            subject=settings.NOTIFICATION_MAIL_WEEKLY_USAGE_REPORT["subject"],
-            message=settings.NOTIFICATION_MAIL_WEEKLY_USAGE_REPORT["message"].format(
-                customer_name=customer_name,
-                total_users=total_users,
-                transcribed_files=transcribed_files,
-                transcribed_minutes=transcribed_minutes,
-                transcribed_minutes_external=transcribed_minutes_external,
-                blocks_purchased=blocks_purchased,
-                blocks_consumed=blocks_consumed,
-                minutes_included=minutes_included,
-                remaining_minutes=remaining_minutes,
-                overage_minutes=overage_minutes,
-            ),
+        return self.__add_template(
+            to_email,
+            "weekly_usage_report",
+            customer_name=customer_name,
+            total_users=total_users,
+            transcribed_files=transcribed_files,
+            transcribed_minutes=transcribed_minutes,
+            transcribed_minutes_external=transcribed_minutes_external,
+            blocks_purchased=blocks_purchased,
+            blocks_consumed=blocks_consumed,
+            minutes_included=minutes_included,
+            remaining_minutes=remaining_minutes,
+            overage_minutes=overage_minutes,
         )
 
 
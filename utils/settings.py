@@ -55,6 +55,12 @@ class Settings(BaseSettings):
     API_CLIENT_VERIFICATION_HEADER: str = "x-client-legacy"
     API_PRIVATE_KEY_PASSWORD: str = ""
 
+    # Database connection pool configuration (per worker process).
+    API_DATABASE_POOL_SIZE: int = 3  # 3 × 8 workers = 24 base
+    API_DATABASE_MAX_OVERFLOW: int = 2  # burst to 5 × 8 = 40 max
+    API_DATABASE_POOL_TIMEOUT: int = 30
+    API_DATABASE_POOL_RECYCLE: int = 1800
+
     # SMTP configuration.
     API_SMTP_HOST: str = ""
     API_SMTP_PORT: int = 25
@@ -90,6 +96,8 @@ class Settings(BaseSettings):
     )  # 1MB - must match chunk_size in encrypt_data_to_file
 
     # E-mail notifications
+    NOTIFICATION_QUEUE_MAX: int = 10000
+
     NOTIFICATION_MAIL_UPDATED: dict = {
         "subject": "Your e-mail address have been updated",
         "message": """\